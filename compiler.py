@@ -1,11 +1,12 @@
 from dataclasses import dataclass
-from enum import Enum, auto
-from typing import Any, Dict, List, Optional, Union
+from enum import Enum, IntEnum, auto
+from typing import Any, Dict, List, Optional, Tuple, Union
 import operator
+import re
 from collections import namedtuple
 
 # Token types and lexer
-class TokenType(Enum):
+class TokenType(IntEnum):
     # Single-character tokens
     LEFT_PAREN = auto()
     RIGHT_PAREN = auto()
@@ -50,148 +51,122 @@ class TokenType(Enum):
     WHILE = auto()
     
     EOF = auto()
+    
+    # Render as TokenType.NAME, not the bare integer IntEnum would give
+    __str__ = Enum.__str__
+    __format__ = Enum.__format__
 
-@dataclass
+@dataclass(slots=True)
 class Token:
     type: TokenType
     lexeme: str
     literal: Any
     line: int
 
+# Master pattern for the scanner. Alternatives are tried left to right, so
+# comments and two-character operators must come before their one-character
+# prefixes, and ERROR must stay last as the catch-all.
+_TOKEN_SPEC: List[Tuple[str, str]] = [
+    ('NUMBER', r'\d+(?:\.\d+)?'),
+    ('IDENTIFIER', r'[^\W\d]\w*'),
+    ('STRING', r'"[^"]*"'),
+    ('UNTERMINATED', r'"'),
+    ('COMMENT', r'//[^\n]*'),
+    ('BANG_EQUAL', r'!='),
+    ('EQUAL_EQUAL', r'=='),
+    ('GREATER_EQUAL', r'>='),
+    ('LESS_EQUAL', r'<='),
+    ('LEFT_PAREN', r'\('),
+    ('RIGHT_PAREN', r'\)'),
+    ('LEFT_BRACE', r'\{'),
+    ('RIGHT_BRACE', r'\}'),
+    ('COMMA', r','),
+    ('DOT', r'\.'),
+    ('MINUS', r'-'),
+    ('PLUS', r'\+'),
+    ('SEMICOLON', r';'),
+    ('SLASH', r'/'),
+    ('STAR', r'\*'),
+    ('BANG', r'!'),
+    ('EQUAL', r'='),
+    ('GREATER', r'>'),
+    ('LESS', r'<'),
+    ('NEWLINE', r'\n'),
+    ('SKIP', r'[ \r\t]+'),
+    ('ERROR', r'.'),
+]
+
+_TOKEN_RE = re.compile('|'.join(f'(?P<{name}>{pattern})' for name, pattern in _TOKEN_SPEC))
+
+# Token type for each regex group, indexed by Match.lastindex (group 1 is
+# the first spec entry). Groups that produce no token of their own map to
+# None and are told apart by name.
+_GROUP_TYPES: List[Optional[TokenType]] = [None, *(TokenType.__members__.get(name) for name, _ in _TOKEN_SPEC)]
+
+def _is_identifier(text: str) -> bool:
+    # \w is slightly wider than isalpha()/isdigit() outside ASCII (it also
+    # takes numerics such as '½'), so non-ASCII matches are re-checked here.
+    return ((text[0].isalpha() or text[0] == '_') and
+            all(c.isalpha() or c.isdigit() or c == '_' for c in text[1:]))
+
 class Scanner:
-    def __init__(self, source: str):
+    keywords: Dict[str, TokenType] = {
+        "and": TokenType.AND,
+        "or": TokenType.OR,
+        "if": TokenType.IF,
+        "else": TokenType.ELSE,
+        "true": TokenType.TRUE,
+        "false": TokenType.FALSE,
+        "fun": TokenType.FUN,
+        "for": TokenType.FOR,
+        "nil": TokenType.NIL,
+        "print": TokenType.PRINT,
+        "return": TokenType.RETURN,
+        "var": TokenType.VAR,
+        "while": TokenType.WHILE
+    }
+    
+    def __init__(self, source: str) -> None:
         self.source = source
         self.tokens: List[Token] = []
-        self.start = 0
-        self.current = 0
         self.line = 1
-        
-        self.keywords = {
-            "and": TokenType.AND,
-            "or": TokenType.OR,
-            "if": TokenType.IF,
-            "else": TokenType.ELSE,
-            "true": TokenType.TRUE,
-            "false": TokenType.FALSE,
-            "fun": TokenType.FUN,
-            "for": TokenType.FOR,
-            "nil": TokenType.NIL,
-            "print": TokenType.PRINT,
-            "return": TokenType.RETURN,
-            "var": TokenType.VAR,
-            "while": TokenType.WHILE
-        }
     
     def scan_tokens(self) -> List[Token]:
-        while not self.is_at_end():
-            self.start = self.current
-            self.scan_token()
-        
-        self.tokens.append(Token(TokenType.EOF, "", None, self.line))
-        return self.tokens
-    
-    def scan_token(self):
-        c = self.advance()
-        
-        match c:
-            case '(': self.add_token(TokenType.LEFT_PAREN)
-            case ')': self.add_token(TokenType.RIGHT_PAREN)
-            case '{': self.add_token(TokenType.LEFT_BRACE)
-            case '}': self.add_token(TokenType.RIGHT_BRACE)
-            case ',': self.add_token(TokenType.COMMA)
-            case '.': self.add_token(TokenType.DOT)
-            case '-': self.add_token(TokenType.MINUS)
-            case '+': self.add_token(TokenType.PLUS)
-            case ';': self.add_token(TokenType.SEMICOLON)
-            case '*': self.add_token(TokenType.STAR)
-            case '!': self.add_token(TokenType.BANG_EQUAL if self.match('=') else TokenType.BANG)
-            case '=': self.add_token(TokenType.EQUAL_EQUAL if self.match('=') else TokenType.EQUAL)
-            case '<': self.add_token(TokenType.LESS_EQUAL if self.match('=') else TokenType.LESS)
-            case '>': self.add_token(TokenType.GREATER_EQUAL if self.match('=') else TokenType.GREATER)
-            case '/':
-                if self.match('/'):
-                    while self.peek() != '\n' and not self.is_at_end():
-                        self.advance()
-                else:
-                    self.add_token(TokenType.SLASH)
-            case ' ' | '\r' | '\t': pass
-            case '\n': self.line += 1
-            case '"': self.string()
-            case _:
-                if self.is_digit(c):
-                    self.number()
-                elif self.is_alpha(c):
-                    self.identifier()
-                else:
-                    raise SyntaxError(f"Unexpected character at line {self.line}")
-    
-    def string(self):
-        while self.peek() != '"' and not self.is_at_end():
-            if self.peek() == '\n':
-                self.line += 1
-            self.advance()
-        
-        if self.is_at_end():
-            raise SyntaxError(f"Unterminated string at line {self.line}")
-        
-        self.advance()  # Closing "
-        value = self.source[self.start + 1:self.current - 1]
-        self.add_token(TokenType.STRING, value)
-    
-    def number(self):
-        while self.is_digit(self.peek()):
-            self.advance()
+        tokens = self.tokens
+        line = self.line
+        keywords = self.keywords
+        IDENTIFIER, NUMBER, STRING = TokenType.IDENTIFIER, TokenType.NUMBER, TokenType.STRING
         
-        if self.peek() == '.' and self.is_digit(self.peek_next()):
-            self.advance()
-            while self.is_digit(self.peek()):
-                self.advance()
-        
-        value = float(self.source[self.start:self.current])
-        self.add_token(TokenType.NUMBER, value)
-    
-    def identifier(self):
-        while self.is_alphanumeric(self.peek()):
-            self.advance()
+        for m in _TOKEN_RE.finditer(self.source):
+            type = _GROUP_TYPES[m.lastindex]  # type: ignore[index]  # every alternative is a group
+            
+            if type is IDENTIFIER:
+                text = m.group()
+                if not text.isascii() and not _is_identifier(text):
+                    raise SyntaxError(f"Unexpected character at line {line}")
+                tokens.append(Token(keywords.get(text, IDENTIFIER), text, None, line))
+            elif type is NUMBER:
+                text = m.group()
+                tokens.append(Token(NUMBER, text, float(text), line))
+            elif type is STRING:
+                text = m.group()
+                line += text.count('\n')
+                tokens.append(Token(STRING, text, text[1:-1], line))
+            elif type is not None:
+                tokens.append(Token(type, m.group(), None, line))
+            else:
+                kind = m.lastgroup
+                if kind == 'NEWLINE':
+                    line += 1
+                elif kind == 'UNTERMINATED':
+                    line += self.source.count('\n', m.end())
+                    raise SyntaxError(f"Unterminated string at line {line}")
+                elif kind == 'ERROR':
+                    raise SyntaxError(f"Unexpected character at line {line}")
         
-        text = self.source[self.start:self.current]
-        type = self.keywords.get(text, TokenType.IDENTIFIER)
-        self.add_token(type)
-    
-    # Helper methods
-    def match(self, expected: str) -> bool:
-        if self.is_at_end() or self.source[self.current] != expected:
-            return False
-        self.current += 1
-        return True
-    
-    def peek(self) -> str:
-        return '\0' if self.is_at_end() else self.source[self.current]
-    
-    def peek_next(self) -> str:
-        if self.current + 1 >= len(self.source):
-            return '\0'
-        return self.source[self.current + 1]
-    
-    def is_alpha(self, c: str) -> bool:
-        return c.isalpha() or c == '_'
-    
-    def is_digit(self, c: str) -> bool:
-        return c.isdigit()
-    
-    def is_alphanumeric(self, c: str) -> bool:
-        return self.is_alpha(c) or self.is_digit(c)
-    
-    def is_at_end(self) -> bool:
-        return self.current >= len(self.source)
-    
-    def advance(self) -> str:
-        self.current += 1
-        return self.source[self.current - 1]
-    
-    def add_token(self, type: TokenType, literal: Any = None):
-        text = self.source[self.start:self.current]
-        self.tokens.append(Token(type, text, literal, self.line))
+        self.line = line
+        tokens.append(Token(TokenType.EOF, "", None, line))
+        return tokens
 
 # AST nodes
 class Expr:
@@ -207,10 +182,17 @@ class Binary(Expr):
 class Grouping(Expr):
     expression: Expr
 
-@dataclass
+@dataclass(frozen=True)
 class Literal(Expr):
     value: Any
 
+# Literals are immutable, so the parser hands out shared instances for the
+# constant keywords and for small whole numbers instead of allocating new ones.
+_LIT_TRUE = Literal(True)
+_LIT_FALSE = Literal(False)
+_LIT_NIL = Literal(None)
+_SMALL_NUMBER_LITS = [Literal(float(i)) for i in range(256)]
+
 @dataclass
 class Unary(Expr):
     operator: Token
@@ -244,7 +226,7 @@ class Var(Stmt):
 
 @dataclass
 class Block(Stmt):
-    statements: List[Stmt]
+    statements: List[Optional[Stmt]]
 
 @dataclass
 class If(Stmt):
@@ -259,17 +241,17 @@ class While(Stmt):
 
 # Parser
 class Parser:
-    def __init__(self, tokens: List[Token]):
+    def __init__(self, tokens: List[Token]) -> None:
         self.tokens = tokens
         self.current = 0
     
-    def parse(self) -> List[Stmt]:
-        statements = []
+    def parse(self) -> List[Optional[Stmt]]:
+        statements: List[Optional[Stmt]] = []
         while not self.is_at_end():
             statements.append(self.declaration())
         return statements
     
-    def declaration(self) -> Stmt:
+    def declaration(self) -> Optional[Stmt]:
         try:
             if self.match(TokenType.VAR):
                 return self.var_declaration()
@@ -324,8 +306,8 @@ class Parser:
         
         return While(condition, body)
     
-    def block(self) -> List[Stmt]:
-        statements = []
+    def block(self) -> List[Optional[Stmt]]:
+        statements: List[Optional[Stmt]] = []
         while not self.check(TokenType.RIGHT_BRACE) and not self.is_at_end():
             statements.append(self.declaration())
         
@@ -405,11 +387,17 @@ class Parser:
         return self.primary()
     
     def primary(self) -> Expr:
-        if self.match(TokenType.FALSE): return Literal(False)
-        if self.match(TokenType.TRUE): return Literal(True)
-        if self.match(TokenType.NIL): return Literal(None)
+        if self.match(TokenType.FALSE): return _LIT_FALSE
+        if self.match(TokenType.TRUE): return _LIT_TRUE
+        if self.match(TokenType.NIL): return _LIT_NIL
         
-        if self.match(TokenType.NUMBER, TokenType.STRING):
+        if self.match(TokenType.NUMBER):
+            value = self.previous().literal
+            if value.is_integer() and 0 <= value < 256:
+                return _SMALL_NUMBER_LITS[int(value)]
+            return Literal(value)
+        
+        if self.match(TokenType.STRING):
             return Literal(self.previous().literal)
         
         if self.match(TokenType.IDENTIFIER):
@@ -424,22 +412,26 @@ class Parser:
     
     # Helper methods
     def match(self, *types: TokenType) -> bool:
-        for type in types:
-            if self.check(type):
-                self.advance()
-                return True
+        type = self.tokens[self.current].type
+        if type in types and type is not TokenType.EOF:
+            self.current += 1
+            return True
         return False
     
     def check(self, type: TokenType) -> bool:
-        return False if self.is_at_end() else self.peek().type == type
+        current_type = self.tokens[self.current].type
+        return current_type == type and current_type is not TokenType.EOF
     
     def advance(self) -> Token:
-        if not self.is_at_end():
-            self.current += 1
-        return self.previous()
+        tokens = self.tokens
+        current = self.current
+        if tokens[current].type is not TokenType.EOF:
+            current += 1
+            self.current = current
+        return tokens[current - 1]
     
     def is_at_end(self) -> bool:
-        return self.peek().type == TokenType.EOF
+        return self.tokens[self.current].type is TokenType.EOF
     
     def peek(self) -> Token:
         return self.tokens[self.current]
@@ -452,11 +444,16 @@ class Parser:
             return self.advance()
         raise SyntaxError(message)
     
-    def synchronize(self):
+    def synchronize(self) -> None:
         self.advance()
         
         while not self.is_at_end():
             if self.previous().type == TokenType.SEMICOLON:
                 return
             
-            match self
+            match self.peek().type:
+                case (TokenType.FUN | TokenType.VAR | TokenType.FOR | TokenType.IF |
+                      TokenType.WHILE | TokenType.PRINT | TokenType.RETURN):
+                    return
+            
+            self.advance()
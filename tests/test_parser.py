@@ -0,0 +1,110 @@
+import dataclasses
+import unittest
+
+import compiler
+from compiler import Literal, Parser, Print, Scanner, TokenType, Var
+
+
+def parser_for(source):
+    return Parser(Scanner(source).scan_tokens())
+
+
+def parse(source):
+    return parser_for(source).parse()
+
+
+class ParserHelperTest(unittest.TestCase):
+    def test_match_and_check_never_accept_eof(self):
+        parser = parser_for("")
+        self.assertFalse(parser.check(TokenType.EOF))
+        self.assertFalse(parser.match(TokenType.EOF))
+        self.assertFalse(parser.match(TokenType.IDENTIFIER, TokenType.EOF))
+        self.assertEqual(parser.current, 0)
+
+    def test_match_consumes_any_listed_type(self):
+        parser = parser_for("x;")
+        self.assertFalse(parser.match(TokenType.NUMBER, TokenType.STRING))
+        self.assertTrue(parser.match(TokenType.NUMBER, TokenType.IDENTIFIER))
+        self.assertEqual(parser.previous().lexeme, "x")
+        self.assertTrue(parser.check(TokenType.SEMICOLON))
+
+    def test_advance_stops_at_eof(self):
+        parser = parser_for("x")
+        self.assertEqual(parser.advance().lexeme, "x")
+        self.assertTrue(parser.is_at_end())
+        self.assertEqual(parser.advance().lexeme, "x")
+        self.assertEqual(parser.current, 1)
+
+        parser = parser_for("")
+        self.assertEqual(parser.advance().type, TokenType.EOF)
+        self.assertEqual(parser.current, 0)
+
+    def test_consume_returns_token_or_raises_message(self):
+        parser = parser_for("x")
+        self.assertEqual(parser.consume(TokenType.IDENTIFIER, "unused").lexeme, "x")
+        with self.assertRaisesRegex(SyntaxError, "Expect ';' after expression."):
+            parser.consume(TokenType.SEMICOLON, "Expect ';' after expression.")
+
+    def test_consume_errors_from_statements(self):
+        with self.assertRaisesRegex(SyntaxError, "Expect ';' after value."):
+            parser_for("print 1").statement()
+        with self.assertRaisesRegex(SyntaxError, r"Expect '\(' after 'if'."):
+            parser_for("if x").statement()
+        with self.assertRaisesRegex(SyntaxError, "Expect '}' after block."):
+            parser_for("{ print 1;").statement()
+
+
+class SynchronizeTest(unittest.TestCase):
+    def test_recovers_after_semicolon(self):
+        statements = parse("var x = ; var y = 1;")
+        self.assertIsNone(statements[0])
+        self.assertIsInstance(statements[1], Var)
+        self.assertEqual(statements[1].name.lexeme, "y")
+        self.assertEqual(len(statements), 2)
+
+    def test_recovers_before_statement_keyword(self):
+        statements = parse("var x = 1 2 print 3;")
+        self.assertEqual(len(statements), 2)
+        self.assertIsNone(statements[0])
+        self.assertIsInstance(statements[1], Print)
+        self.assertEqual(statements[1].expression.value, 3.0)
+
+    def test_recovers_at_end_of_input(self):
+        self.assertEqual(parse("var = 1"), [None])
+
+
+class LiteralTest(unittest.TestCase):
+    def literal(self, source):
+        return parser_for(source).primary()
+
+    def test_constant_keywords_are_shared(self):
+        self.assertIs(self.literal("true"), compiler._LIT_TRUE)
+        self.assertIs(self.literal("false"), compiler._LIT_FALSE)
+        self.assertIs(self.literal("nil"), compiler._LIT_NIL)
+        self.assertIs(compiler._LIT_TRUE.value, True)
+        self.assertIs(compiler._LIT_FALSE.value, False)
+        self.assertIsNone(compiler._LIT_NIL.value)
+
+    def test_small_whole_numbers_are_shared(self):
+        self.assertIs(self.literal("0"), compiler._SMALL_NUMBER_LITS[0])
+        self.assertIs(self.literal("1"), compiler._SMALL_NUMBER_LITS[1])
+        self.assertIs(self.literal("255"), compiler._SMALL_NUMBER_LITS[255])
+        self.assertIs(self.literal("1"), self.literal("1.0"))
+        self.assertEqual(self.literal("255").value, 255.0)
+        self.assertIsInstance(self.literal("1").value, float)
+
+    def test_other_literals_are_fresh(self):
+        for source, value in (("256", 256.0), ("1.5", 1.5), ('"hi"', "hi")):
+            first, second = self.literal(source), self.literal(source)
+            self.assertIsInstance(first, Literal)
+            self.assertIsNot(first, second)
+            self.assertEqual(first.value, value)
+            self.assertNotIn(first, compiler._SMALL_NUMBER_LITS)
+
+    def test_literal_is_frozen(self):
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            self.literal("1").value = 2.0
+
+
+if __name__ == '__main__':
+    unittest.main()
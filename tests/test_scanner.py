@@ -0,0 +1,83 @@
+import unittest
+
+from compiler import Scanner, TokenType
+
+
+def scan(source):
+    return Scanner(source).scan_tokens()
+
+
+def types(source):
+    return [token.type for token in scan(source)]
+
+
+class ScannerTest(unittest.TestCase):
+    def test_keywords_and_identifiers(self):
+        self.assertEqual(
+            types("and or if else true false fun for nil print return var while"),
+            [TokenType.AND, TokenType.OR, TokenType.IF, TokenType.ELSE,
+             TokenType.TRUE, TokenType.FALSE, TokenType.FUN, TokenType.FOR,
+             TokenType.NIL, TokenType.PRINT, TokenType.RETURN, TokenType.VAR,
+             TokenType.WHILE, TokenType.EOF])
+        tokens = scan("iffy _x var1 orchid")
+        self.assertEqual([t.type for t in tokens[:-1]], [TokenType.IDENTIFIER] * 4)
+        self.assertEqual([t.lexeme for t in tokens[:-1]], ["iffy", "_x", "var1", "orchid"])
+
+    def test_unicode_identifiers_and_digits(self):
+        tokens = scan("café naïve_2 π ١٢")
+        self.assertEqual([(t.type, t.lexeme) for t in tokens[:3]],
+                         [(TokenType.IDENTIFIER, "café"), (TokenType.IDENTIFIER, "naïve_2"),
+                          (TokenType.IDENTIFIER, "π")])
+        self.assertEqual((tokens[3].type, tokens[3].literal), (TokenType.NUMBER, 12.0))
+
+    def test_one_and_two_character_operators(self):
+        self.assertEqual(
+            types("! != = == < <= > >= ( ) { } , . - + ; / *"),
+            [TokenType.BANG, TokenType.BANG_EQUAL, TokenType.EQUAL,
+             TokenType.EQUAL_EQUAL, TokenType.LESS, TokenType.LESS_EQUAL,
+             TokenType.GREATER, TokenType.GREATER_EQUAL, TokenType.LEFT_PAREN,
+             TokenType.RIGHT_PAREN, TokenType.LEFT_BRACE, TokenType.RIGHT_BRACE,
+             TokenType.COMMA, TokenType.DOT, TokenType.MINUS, TokenType.PLUS,
+             TokenType.SEMICOLON, TokenType.SLASH, TokenType.STAR, TokenType.EOF])
+        self.assertEqual(types("a<=b"), [TokenType.IDENTIFIER, TokenType.LESS_EQUAL,
+                                         TokenType.IDENTIFIER, TokenType.EOF])
+
+    def test_numbers(self):
+        tokens = scan("12 3.5 7.")
+        self.assertEqual([(t.type, t.literal) for t in tokens],
+                         [(TokenType.NUMBER, 12.0), (TokenType.NUMBER, 3.5),
+                          (TokenType.NUMBER, 7.0), (TokenType.DOT, None),
+                          (TokenType.EOF, None)])
+
+    def test_comments_are_skipped(self):
+        tokens = scan("a // comment ( \"\nb / c")
+        self.assertEqual([t.type for t in tokens],
+                         [TokenType.IDENTIFIER, TokenType.IDENTIFIER,
+                          TokenType.SLASH, TokenType.IDENTIFIER, TokenType.EOF])
+        self.assertEqual([t.line for t in tokens], [1, 2, 2, 2, 2])
+
+    def test_multi_line_string_and_line_counting(self):
+        tokens = scan('a\n"one\ntwo"\r\n\tb')
+        self.assertEqual([(t.type, t.line) for t in tokens],
+                         [(TokenType.IDENTIFIER, 1), (TokenType.STRING, 3),
+                          (TokenType.IDENTIFIER, 4), (TokenType.EOF, 4)])
+        self.assertEqual(tokens[1].lexeme, '"one\ntwo"')
+        self.assertEqual(tokens[1].literal, "one\ntwo")
+
+    def test_token_type_renders_by_name(self):
+        self.assertEqual(str(TokenType.PLUS), "TokenType.PLUS")
+        self.assertEqual(f"{TokenType.PLUS}", "TokenType.PLUS")
+
+    def test_unterminated_string(self):
+        with self.assertRaisesRegex(SyntaxError, "Unterminated string at line 3"):
+            scan('a\n"open\n')
+
+    def test_unexpected_character(self):
+        with self.assertRaisesRegex(SyntaxError, "Unexpected character at line 2"):
+            scan("a\n@")
+        with self.assertRaisesRegex(SyntaxError, "Unexpected character at line 1"):
+            scan("½;")
+
+
+if __name__ == '__main__':
+    unittest.main()